@@ -31,6 +31,22 @@ setup(
         "typing-extensions>=4.0.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "streaming": [
+            "ijson>=3.1.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "cache": [
+            "cachetools>=4.0.0",
+        ],
+        "speedups": [
+            "orjson>=3.6.0",
+            "ciso8601>=2.2.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
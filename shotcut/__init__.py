@@ -1,5 +1,8 @@
 from .api import ShotcutAPI
-from .exceptions import ShotcutAPIError
+from .async_api import ShotcutAPIAsync
+from .exceptions import (BulkRequestError, RateLimitError, RequestTimeoutError,
+                         ShotcutAPIError)
 
 __version__ = "1.0.0"
-__all__ = ["ShotcutAPI", "ShotcutAPIError"]
+__all__ = ["ShotcutAPI", "ShotcutAPIAsync", "ShotcutAPIError", "RateLimitError", "RequestTimeoutError",
+           "BulkRequestError"]
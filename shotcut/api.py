@@ -1,32 +1,170 @@
-import requests
-from typing import Dict, List, Optional, Union
-import json
+import copy
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterator, List,
+                    Optional, Sequence, Tuple, Union)
 
-class ShotcutAPIError(Exception):
-    """Custom exception for Shotcut API errors"""
-    pass
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:  # pragma: no cover - optional dependency
+    TTLCache = None  # type: ignore[assignment, misc]
+
+try:
+    import h2  # noqa: F401 - httpx needs it to negotiate HTTP/2
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .endpoints import install_endpoints
+from .exceptions import (BulkRequestError, RateLimitError, RequestTimeoutError,
+                         ShotcutAPIError)
+from .models import Link, hydrate_page
+from .ratelimit import (IDEMPOTENT_METHODS, MAX_RETRIES, MAX_TIMEOUT_RETRIES,
+                        HeaderRateLimiter, backoff_delay)
+from .utils import (clean_params, dumps_json, endpoint_path, get_total_pages,
+                    loads_json, make_url_body_encoder)
+
+# Transport-level failures of whichever HTTP backend is in use
+_TRANSPORT_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if httpx else ())
 
 class ShotcutAPI:
     """
     Python client for the Shotcut.in API
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_ttl: float = 0, cache_maxsize: int = 1024, http2: bool = False,
+                 timeout: Tuple[float, float] = (5.0, 30.0), max_workers: int = 8):
         """
         Initialize the Shotcut API client
         
         Args:
             api_key (str): Your Shotcut API key
+            cache_ttl (float): Seconds to cache successful GET responses; 0 disables caching.
+                Any POST, PUT or DELETE made through the client clears the cache.
+            cache_maxsize (int): Maximum number of cached GET responses
+            http2 (bool): Multiplex requests over HTTP/2 using httpx. Falls back to
+                requests (HTTP/1.1) when the "http2" extra is not installed.
+            timeout (tuple): (connect, read) timeouts in seconds for every request
+            max_workers (int): Default number of threads used by the bulk helpers
         """
         self.api_key = api_key
-        self.base_url = "https://shotcut.in/api"
+        self.timeout = timeout
+        self.max_workers = max_workers
+        # Enough pooled connections for every bulk worker, so none opens a throwaway connection
+        pool_size = max(64, max_workers)
+        self._base = "https://shotcut.in/api/"
         self.headers = {
             "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
         }
+        if http2 and httpx is None:
+            warnings.warn("HTTP/2 requires httpx[http2]: pip install shotcut-python[http2]; "
+                          "falling back to HTTP/1.1", RuntimeWarning, stacklevel=2)
+        self._http2 = bool(http2 and httpx is not None)
+        self._session: Union[requests.Session, "httpx.Client"]
+        if self._http2:
+            self._session = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=pool_size),
+                timeout=httpx.Timeout(connect=timeout[0], read=timeout[1], write=timeout[1], pool=timeout[0])
+            )
+        else:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            # 429 is left to the rate limiter and timeouts to _make_request, so urllib3 only
+            # retries idempotent requests that got a 5xx gateway error
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=pool_size,
+                pool_block=True,
+                max_retries=Retry(total=3, connect=0, read=False, backoff_factor=0.3,
+                                  status_forcelist=[502, 503, 504])
+            )
+            session.mount("https://", adapter)
+            self._session = session
+        self._limiter = HeaderRateLimiter()
+        self._cache: Optional["TTLCache"] = None
+        self._cache_lock = threading.Lock()
+        if cache_ttl > 0:
+            if TTLCache is None:
+                raise ImportError("Response caching requires cachetools: pip install shotcut-python[cache]")
+            self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the API, without a trailing slash"""
+        return self._base[:-1]
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        # Keep the trailing slash so request URLs are built with a single concatenation
+        self._base = value.rstrip("/") + "/"
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        self._session.close()
+
+    def __enter__(self) -> "ShotcutAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _send(self, method: str, url: str, body: Optional[bytes] = None, params: Optional[Dict] = None):
+        """Send a request on the configured HTTP backend"""
+        if isinstance(self._session, requests.Session):
+            return self._session.request(method=method, url=url, data=body, params=params, timeout=self.timeout)
+        return self._session.request(method, url, content=body, params=params)
+
+    def _stream(self, url: str, params: Optional[Dict] = None):
+        """Open a streaming GET request on the configured HTTP backend"""
+        if isinstance(self._session, requests.Session):
+            return self._session.get(url, params=params, stream=True, timeout=self.timeout)
+        return self._session.stream("GET", url, params=params)
+
+    def _iter_body(self, response) -> Iterator[bytes]:
+        """Iterate over the decoded body chunks of a streaming response"""
+        if self._http2:
+            return response.iter_bytes()
+        return response.iter_content(chunk_size=65536)
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """
+        Drop cached GET responses
+
+        Args:
+            endpoint (str, optional): Only drop entries for this endpoint and the
+                paths below it, e.g. "url/42". Drops everything when omitted.
+        """
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            if endpoint is None:
+                self._cache.clear()
+                return
+            prefix = endpoint + "/"
+            for key in [key for key in self._cache if key[0] == endpoint or key[0].startswith(prefix)]:
+                self._cache.pop(key, None)
         
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None,
+                      body: Optional[bytes] = None) -> Dict:
         """
         Make HTTP request to the API
         
@@ -35,57 +173,145 @@ class ShotcutAPI:
             endpoint (str): API endpoint
             data (dict, optional): Request body data
             params (dict, optional): Query parameters
+            body (bytes, optional): Pre-encoded JSON body, used instead of ``data``
             
         Returns:
             dict: Response data
         """
-        url = f"{self.base_url}/{endpoint}"
+        cache_key = None
+        if self._cache is not None and method == "GET":
+            cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        url = self._base + endpoint
+        # Content-Type is set once on the session, so send the pre-encoded body as-is
+        if body is None and data:
+            body = dumps_json(data)
         
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=data if data else None,
-                params=params if params else None
-            )
-            
-            response_data = response.json()
+            timeouts = 0
+            for attempt in range(MAX_RETRIES + 1):
+                # Wait for the rate limit window to reset instead of burning a request
+                self._limiter.wait_if_throttled()
+
+                try:
+                    response = self._send(method, url, body, params if params else None)
+                except _TIMEOUT_ERRORS as e:
+                    timeouts += 1
+                    if (method not in IDEMPOTENT_METHODS or timeouts > MAX_TIMEOUT_RETRIES
+                            or attempt == MAX_RETRIES):
+                        raise RequestTimeoutError(f"Request timed out: {str(e)}")
+                    time.sleep(backoff_delay(attempt))
+                    continue
+                self._limiter.update(response.headers)
+
+                if response.status_code != 429:
+                    break
+                if attempt < MAX_RETRIES:
+                    time.sleep(backoff_delay(attempt))
+            else:
+                reset_time = datetime.fromtimestamp(self._limiter.reset_ts or 0)
+                raise RateLimitError(f"Rate limit exceeded. Reset at {reset_time}", status_code=429)
             
-            # Check for rate limit headers
-            if response.headers.get('X-RateLimit-Remaining') == '0':
-                reset_time = datetime.fromtimestamp(int(response.headers.get('X-RateLimit-Reset', 0)))
-                raise ShotcutAPIError(f"Rate limit exceeded. Reset at {reset_time}")
+            try:
+                response_data = loads_json(response.content)
+            except ValueError:
+                raise ShotcutAPIError("Invalid JSON in API response", status_code=response.status_code)
             
             # Check for API errors
             if response_data.get('error') and response_data['error'] != 0:
-                raise ShotcutAPIError(response_data.get('message', 'Unknown API error'))
+                raise ShotcutAPIError(response_data.get('message', 'Unknown API error'),
+                                      status_code=response.status_code, response=response_data)
+
+            if cache_key is not None and self._cache is not None:
+                with self._cache_lock:
+                    self._cache[cache_key] = copy.deepcopy(response_data)
                 
             return response_data
             
-        except requests.exceptions.RequestException as e:
+        except _TRANSPORT_ERRORS as e:
             raise ShotcutAPIError(f"Request failed: {str(e)}")
+        finally:
+            if self._cache is not None and method != "GET":
+                # A write can change list pages as well as the item itself (a new link shows
+                # up in "urls", an assignment in "channel/3"), and a failed or timed-out write
+                # may still have been applied, so every write drops the whole cache
+                self.invalidate()
+
+    def iterate_all(self, endpoint: str, limit: int = 100, max_workers: Optional[int] = None, **params) -> Iterator[Dict]:
+        """
+        Iterate over every page of a paginated endpoint
 
-    # Account Methods
-    def get_account(self) -> Dict:
-        """Get account information"""
-        return self._make_request("GET", "account")
+        The first page is fetched to learn the page count, then the remaining
+        pages are fetched concurrently over the shared session.
+
+        Args:
+            endpoint (str): Paginated API endpoint, e.g. "urls" or "campaigns"
+            limit (int): Items per page
+            max_workers (int, optional): Number of pages fetched in parallel, defaults to the client's max_workers
+            **params: Extra query parameters sent with every page
 
+        Yields:
+            dict: Response data for each page, in page order
+        """
+        first = self._make_request("GET", endpoint, params={**params, 'limit': limit, 'page': 1})
+        yield first
+
+        total_pages = get_total_pages(first)
+        if total_pages < 2:
+            return
+
+        def fetch(page: int) -> Dict:
+            return self._make_request("GET", endpoint, params={**params, 'limit': limit, 'page': page})
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            yield from executor.map(fetch, range(2, total_pages + 1))
+
+    def _run_concurrently(self, calls: Sequence[Callable[[], Dict]], max_workers: Optional[int] = None,
+                          retry: bool = True) -> List[Dict]:
+        """
+        Run independent API calls on a thread pool sharing the session
+
+        Every call runs, and with ``retry`` calls that fail with ShotcutAPIError
+        are retried once after the batch completes. Calls that still fail are
+        reported together in a BulkRequestError that carries the completed
+        results.
+
+        Returns:
+            list: Results in the same order as ``calls``
+        """
+        results: List[Any] = [None] * len(calls)
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = {executor.submit(call): index for index, call in enumerate(calls)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except ShotcutAPIError as e:
+                    results[index] = e
+                    failed.append(index)
+        if retry:
+            for index in sorted(failed):
+                try:
+                    results[index] = calls[index]()
+                except ShotcutAPIError as e:
+                    results[index] = e
+            failed = [index for index in failed if isinstance(results[index], ShotcutAPIError)]
+        if failed:
+            raise BulkRequestError(f"{len(failed)} of {len(calls)} requests failed", results=results)
+        return results
+
+    # Account Methods
     def update_account(self, email: Optional[str] = None, password: Optional[str] = None) -> Dict:
         """Update account information"""
-        data = {}
-        if email:
-            data['email'] = email
-        if password:
-            data['password'] = password
+        data = clean_params({'email': email, 'password': password})
         return self._make_request("PUT", "account/update", data=data)
 
     # Branded Domains Methods
-    def list_domains(self, limit: int = 10, page: int = 1) -> Dict:
-        """List branded domains"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", "domains", params=params)
-
     def create_domain(self, domain: str, redirect_root: Optional[str] = None, redirect_404: Optional[str] = None) -> Dict:
         """Create a branded domain"""
         data = {
@@ -97,29 +323,11 @@ class ShotcutAPI:
 
     def update_domain(self, domain_id: int, redirect_root: Optional[str] = None, redirect_404: Optional[str] = None) -> Dict:
         """Update a branded domain"""
-        data = {}
-        if redirect_root:
-            data['redirectroot'] = redirect_root
-        if redirect_404:
-            data['redirect404'] = redirect_404
-        return self._make_request("PUT", f"domain/{domain_id}/update", data=data)
-
-    def delete_domain(self, domain_id: int) -> Dict:
-        """Delete a branded domain"""
-        return self._make_request("DELETE", f"domain/{domain_id}/delete")
-
-    # CTA Overlays Methods
-    def list_overlays(self, limit: int = 10, page: int = 1) -> Dict:
-        """List CTA overlays"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", "overlay", params=params)
+        data = clean_params({'redirectroot': redirect_root, 'redirect404': redirect_404})
+        endpoint = endpoint_path("domain/{domain_id}/update", domain_id=domain_id)
+        return self._make_request("PUT", endpoint, data=data)
 
     # Campaigns Methods
-    def list_campaigns(self, limit: int = 10, page: int = 1) -> Dict:
-        """List campaigns"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", "campaigns", params=params)
-
     def create_campaign(self, name: str, slug: Optional[str] = None, public: bool = False) -> Dict:
         """Create a campaign"""
         data = {
@@ -129,34 +337,19 @@ class ShotcutAPI:
         }
         return self._make_request("POST", "campaign/add", data=data)
 
-    def assign_link_to_campaign(self, campaign_id: int, link_id: int) -> Dict:
-        """Assign a link to a campaign"""
-        return self._make_request("POST", f"campaign/{campaign_id}/assign/{link_id}")
-
     def update_campaign(self, campaign_id: int, name: str, slug: Optional[str] = None, public: Optional[bool] = None) -> Dict:
         """Update a campaign"""
-        data = {'name': name}
-        if slug:
-            data['slug'] = slug
-        if public is not None:
-            data['public'] = public
-        return self._make_request("PUT", f"campaign/{campaign_id}/update", data=data)
+        data = clean_params({'name': name, 'slug': slug, 'public': public})
+        endpoint = endpoint_path("campaign/{campaign_id}/update", campaign_id=campaign_id)
+        return self._make_request("PUT", endpoint, data=data)
 
-    def delete_campaign(self, campaign_id: int) -> Dict:
-        """Delete a campaign"""
-        return self._make_request("DELETE", f"campaign/{campaign_id}/delete")
+    def assign_links_to_campaign(self, campaign_id: int, link_ids: List[int],
+                                 max_workers: Optional[int] = None) -> List[Dict]:
+        """Assign several links to a campaign concurrently, returning results in the order of ``link_ids``"""
+        calls = [partial(self.assign_link_to_campaign, campaign_id, link_id) for link_id in link_ids]
+        return self._run_concurrently(calls, max_workers)
 
     # Channels Methods
-    def list_channels(self, limit: int = 10, page: int = 1) -> Dict:
-        """List channels"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", "channels", params=params)
-
-    def list_channel_items(self, channel_id: int, limit: int = 10, page: int = 1) -> Dict:
-        """List items in a channel"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", f"channel/{channel_id}", params=params)
-
     def create_channel(self, name: str, description: Optional[str] = None, 
                       color: Optional[str] = None, starred: bool = False) -> Dict:
         """Create a channel"""
@@ -168,46 +361,118 @@ class ShotcutAPI:
         }
         return self._make_request("POST", "channel/add", data=data)
 
-    def assign_item_to_channel(self, channel_id: int, item_type: str, item_id: int) -> Dict:
-        """Assign an item to a channel"""
-        return self._make_request("POST", f"channel/{channel_id}/assign/{item_type}/{item_id}")
-
     def update_channel(self, channel_id: int, name: Optional[str] = None, 
                       description: Optional[str] = None, color: Optional[str] = None, 
                       starred: Optional[bool] = None) -> Dict:
         """Update a channel"""
-        data = {}
-        if name:
-            data['name'] = name
-        if description:
-            data['description'] = description
-        if color:
-            data['color'] = color
-        if starred is not None:
-            data['starred'] = starred
-        return self._make_request("PUT", f"channel/{channel_id}/update", data=data)
-
-    def delete_channel(self, channel_id: int) -> Dict:
-        """Delete a channel"""
-        return self._make_request("DELETE", f"channel/{channel_id}/delete")
-
-    # Custom Splash Methods
-    def list_splash(self, limit: int = 10, page: int = 1) -> Dict:
-        """List custom splash pages"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", "splash", params=params)
+        data = clean_params({
+            'name': name,
+            'description': description,
+            'color': color,
+            'starred': starred
+        })
+        endpoint = endpoint_path("channel/{channel_id}/update", channel_id=channel_id)
+        return self._make_request("PUT", endpoint, data=data)
+
+    def assign_items_to_channel(self, channel_id: int, items: List[Tuple[str, int]],
+                                max_workers: Optional[int] = None) -> List[Dict]:
+        """Assign several (item_type, item_id) pairs to a channel concurrently, returning results in order"""
+        calls = [partial(self.assign_item_to_channel, channel_id, item_type, item_id) for item_type, item_id in items]
+        return self._run_concurrently(calls, max_workers)
 
     # Links Methods
-    def list_links(self, limit: int = 10, page: int = 1, order: str = 'date', short: Optional[str] = None) -> Dict:
-        """List links"""
-        params = {'limit': limit, 'page': page, 'order': order}
-        if short:
-            params['short'] = short
-        return self._make_request("GET", "urls", params=params)
+    def stream_links(self, limit: int = 1000, page: int = 1, order: str = 'date',
+                     short: Optional[str] = None, batch_size: int = 128) -> Iterator[Link]:
+        """
+        Stream a large page of links without buffering the whole response
+
+        Records are parsed incrementally as the body arrives and hydrated into
+        Link models in batches. Requires the optional ``ijson`` dependency
+        (``pip install shotcut-python[streaming]``); prefer list_links for small pages.
 
-    def get_link(self, link_id: int) -> Dict:
-        """Get a single link"""
-        return self._make_request("GET", f"url/{link_id}")
+        Args:
+            limit (int): Items per page
+            page (int): Page number
+            order (str): Sort order
+            short (str, optional): Filter by short alias
+            batch_size (int): Number of records hydrated together
+
+        Yields:
+            Link: Each link in the page
+        """
+        if ijson is None:
+            raise ImportError("stream_links requires ijson: pip install shotcut-python[streaming]")
+        params = clean_params({'limit': limit, 'page': page, 'order': order, 'short': short})
+
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                # Same pacing and 429 policy as _make_request; nothing is yielded before a non-429 response
+                self._limiter.wait_if_throttled()
+                with self._stream(self._base + "urls", params=params) as response:
+                    self._limiter.update(response.headers)
+                    if response.status_code != 429:
+                        if response.status_code >= 400:
+                            raise self._stream_error(response)
+                        yield from self._parse_links(response, batch_size)
+                        return
+                if attempt < MAX_RETRIES:
+                    time.sleep(backoff_delay(attempt))
+            reset_time = datetime.fromtimestamp(self._limiter.reset_ts or 0)
+            raise RateLimitError(f"Rate limit exceeded. Reset at {reset_time}", status_code=429)
+
+        except _TIMEOUT_ERRORS as e:
+            raise RequestTimeoutError(f"Request timed out: {str(e)}")
+        except _TRANSPORT_ERRORS as e:
+            raise ShotcutAPIError(f"Request failed: {str(e)}")
+        except ijson.JSONError as e:
+            raise ShotcutAPIError(f"Invalid JSON in API response: {str(e)}")
+
+    def _stream_error(self, response) -> ShotcutAPIError:
+        """Build the error for a non-2xx streamed response from its (small) JSON body"""
+        try:
+            response_data = loads_json(b"".join(self._iter_body(response)))
+        except ValueError:
+            response_data = None
+        if isinstance(response_data, dict) and response_data.get('message'):
+            return ShotcutAPIError(response_data['message'], status_code=response.status_code,
+                                   response=response_data)
+        return ShotcutAPIError(f"Request failed with status {response.status_code}",
+                               status_code=response.status_code)
+
+    def _parse_links(self, response, batch_size: int) -> Iterator[Link]:
+        """Incrementally parse a streamed links page, raising API errors like _make_request"""
+        # Push decoded chunks into ijson as they arrive and drain parsed rows. The
+        # top-level error/message scalars are picked up by their own parsers.
+        rows, errors, messages = ijson.sendable_list(), ijson.sendable_list(), ijson.sendable_list()
+        parsers = (
+            ijson.items_coro(rows, 'items.item', use_float=True),
+            ijson.items_coro(errors, 'error'),
+            ijson.items_coro(messages, 'message'),
+        )
+
+        def check_error(finished: bool) -> None:
+            # Error bodies are small, so the message normally arrives in the same chunk
+            if errors and errors[0] and (messages or finished):
+                response_data = {'error': errors[0], 'message': messages[0] if messages else None}
+                raise ShotcutAPIError(messages[0] if messages else 'Unknown API error',
+                                      status_code=response.status_code, response=response_data)
+
+        batch = []
+        for chunk in self._iter_body(response):
+            for parser in parsers:
+                parser.send(chunk)
+            check_error(False)
+            batch.extend(rows)
+            del rows[:]
+            if len(batch) >= batch_size:
+                yield from hydrate_page(Link, batch)
+                batch = []
+        for parser in parsers:
+            parser.close()
+        check_error(True)
+        batch.extend(rows)
+        if batch:
+            yield from hydrate_page(Link, batch)
 
     def shorten_link(self, url: str, **kwargs) -> Dict:
         """
@@ -220,20 +485,34 @@ class ShotcutAPI:
         data = {'url': url, **kwargs}
         return self._make_request("POST", "url/add", data=data)
 
+    def shorten_links_bulk(self, urls: List[str], max_workers: Optional[int] = None, **common_kwargs) -> List[Dict]:
+        """
+        Shorten many URLs that share the same options, concurrently
+
+        The shared options are JSON-encoded once and only the URL is encoded
+        per request. Failed requests are not retried, since repeating a
+        shortening request could create duplicate links; if any fail, a
+        BulkRequestError is raised whose ``results`` hold each response or
+        error in the order of ``urls``.
+
+        Args:
+            urls (list): URLs to shorten
+            max_workers (int, optional): Number of requests in flight, defaults to the client's max_workers
+            **common_kwargs: Optional parameters applied to every link (custom, type, domain, expiry, etc.)
+
+        Returns:
+            list: Responses in the same order as ``urls``
+        """
+        encode = make_url_body_encoder(common_kwargs)
+        calls = [partial(self._make_request, "POST", "url/add", body=encode(url)) for url in urls]
+        return self._run_concurrently(calls, max_workers, retry=False)
+
     def update_link(self, link_id: int, **kwargs) -> Dict:
         """Update a link"""
-        return self._make_request("PUT", f"url/{link_id}/update", data=kwargs)
-
-    def delete_link(self, link_id: int) -> Dict:
-        """Delete a link"""
-        return self._make_request("DELETE", f"url/{link_id}/delete")
+        endpoint = endpoint_path("url/{link_id}/update", link_id=link_id)
+        return self._make_request("PUT", endpoint, data=kwargs)
 
     # Pixels Methods
-    def list_pixels(self, limit: int = 10, page: int = 1) -> Dict:
-        """List pixels"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", "pixels", params=params)
-
     def create_pixel(self, type: str, name: str, tag: str) -> Dict:
         """Create a pixel"""
         data = {
@@ -245,27 +524,11 @@ class ShotcutAPI:
 
     def update_pixel(self, pixel_id: int, name: Optional[str] = None, tag: Optional[str] = None) -> Dict:
         """Update a pixel"""
-        data = {}
-        if name:
-            data['name'] = name
-        if tag:
-            data['tag'] = tag
-        return self._make_request("PUT", f"pixel/{pixel_id}/update", data=data)
-
-    def delete_pixel(self, pixel_id: int) -> Dict:
-        """Delete a pixel"""
-        return self._make_request("DELETE", f"pixel/{pixel_id}/delete")
+        data = clean_params({'name': name, 'tag': tag})
+        endpoint = endpoint_path("pixel/{pixel_id}/update", pixel_id=pixel_id)
+        return self._make_request("PUT", endpoint, data=data)
 
     # QR Codes Methods
-    def list_qr_codes(self, limit: int = 10, page: int = 1) -> Dict:
-        """List QR codes"""
-        params = {'limit': limit, 'page': page}
-        return self._make_request("GET", "qr", params=params)
-
-    def get_qr_code(self, qr_id: int) -> Dict:
-        """Get a single QR code"""
-        return self._make_request("GET", f"qr/{qr_id}")
-
     def create_qr_code(self, type: str, data: Union[str, Dict], 
                       background: Optional[str] = None, 
                       foreground: Optional[str] = None,
@@ -288,15 +551,49 @@ class ShotcutAPI:
                       foreground: Optional[str] = None,
                       logo: Optional[str] = None) -> Dict:
         """Update a QR code"""
-        qr_data = {'data': data}
-        if background:
-            qr_data['background'] = background
-        if foreground:
-            qr_data['foreground'] = foreground
-        if logo:
-            qr_data['logo'] = logo
-        return self._make_request("PUT", f"qr/{qr_id}/update", data=qr_data)
-
-    def delete_qr_code(self, qr_id: int) -> Dict:
-        """Delete a QR code"""
-        return self._make_request("DELETE", f"qr/{qr_id}/delete")
\ No newline at end of file
+        qr_data = clean_params({
+            'data': data,
+            'background': background,
+            'foreground': foreground,
+            'logo': logo
+        })
+        endpoint = endpoint_path("qr/{qr_id}/update", qr_id=qr_id)
+        return self._make_request("PUT", endpoint, data=qr_data)
+
+    if TYPE_CHECKING:
+        # Signatures of the methods install_endpoints() generates from ENDPOINTS, declared
+        # for type checkers and IDEs; tests/test_endpoints.py checks they stay in sync
+        # Account
+        def get_account(self) -> Dict: ...
+        # Branded Domains
+        def list_domains(self, limit: int = 10, page: int = 1) -> Dict: ...
+        def delete_domain(self, domain_id: int) -> Dict: ...
+        # CTA Overlays
+        def list_overlays(self, limit: int = 10, page: int = 1) -> Dict: ...
+        # Campaigns
+        def list_campaigns(self, limit: int = 10, page: int = 1) -> Dict: ...
+        def assign_link_to_campaign(self, campaign_id: int, link_id: int) -> Dict: ...
+        def delete_campaign(self, campaign_id: int) -> Dict: ...
+        # Channels
+        def list_channels(self, limit: int = 10, page: int = 1) -> Dict: ...
+        def list_channel_items(self, channel_id: int, limit: int = 10, page: int = 1) -> Dict: ...
+        def assign_item_to_channel(self, channel_id: int, item_type: str, item_id: int) -> Dict: ...
+        def delete_channel(self, channel_id: int) -> Dict: ...
+        # Custom Splash
+        def list_splash(self, limit: int = 10, page: int = 1) -> Dict: ...
+        # Links
+        def list_links(self, limit: int = 10, page: int = 1,
+                       order: str = 'date', short: Optional[str] = None) -> Dict: ...
+        def get_link(self, link_id: int) -> Dict: ...
+        def delete_link(self, link_id: int) -> Dict: ...
+        # Pixels
+        def list_pixels(self, limit: int = 10, page: int = 1) -> Dict: ...
+        def delete_pixel(self, pixel_id: int) -> Dict: ...
+        # QR Codes
+        def list_qr_codes(self, limit: int = 10, page: int = 1) -> Dict: ...
+        def get_qr_code(self, qr_id: int) -> Dict: ...
+        def delete_qr_code(self, qr_id: int) -> Dict: ...
+
+# Methods that map onto a single request (list_*, get_*, delete_*, assign_*)
+# are generated from the table in shotcut.endpoints
+install_endpoints(ShotcutAPI)
@@ -0,0 +1,520 @@
+import asyncio
+import time
+import warnings
+from collections import deque
+from datetime import datetime
+from functools import partial
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable,
+                    Deque, Dict, List, Optional, Sequence, Tuple, Union)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401 - httpx needs it to negotiate HTTP/2
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .endpoints import install_endpoints
+from .exceptions import (BulkRequestError, RateLimitError, RequestTimeoutError,
+                         ShotcutAPIError)
+from .ratelimit import (IDEMPOTENT_METHODS, MAX_RETRIES, MAX_TIMEOUT_RETRIES,
+                        HeaderRateLimiter, backoff_delay)
+from .utils import (clean_params, dumps_json, endpoint_path, get_total_pages,
+                    loads_json, make_url_body_encoder)
+
+# Transport-level failures of whichever HTTP backend is in use
+_TRANSPORT_ERRORS = ((aiohttp.ClientError,) if aiohttp else ()) + ((httpx.HTTPError,) if httpx else ())
+# Dropped or refused connections, which also shrink the concurrency window
+_CONNECTION_ERRORS = ((aiohttp.ClientConnectionError,) if aiohttp else ()) + ((httpx.TransportError,) if httpx else ())
+_TIMEOUT_ERRORS = (asyncio.TimeoutError,) + ((httpx.TimeoutException,) if httpx else ())
+
+# Status codes that signal server overload and shrink the concurrency window
+_BACKOFF_STATUSES = frozenset([429, 502, 503, 504])
+
+def _api_failures(results: List[Any]) -> List[int]:
+    """Indexes of the gathered results that failed with ShotcutAPIError, re-raising any other exception"""
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, ShotcutAPIError):
+            raise result
+    return [index for index, result in enumerate(results) if isinstance(result, ShotcutAPIError)]
+
+class _AIMDGate:
+    """
+    Admission gate whose capacity adapts with additive-increase/multiplicative-decrease
+
+    The window grows by ``increase`` after each healthy response while the rolling
+    average latency stays under ``target_latency``, and is halved on overload
+    signals (429/5xx responses, dropped connections). Only requests sent after
+    the last decrease can halve it again, so a burst of overloaded responses
+    that were already in flight counts as a single signal.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 128,
+                 target_latency: float = 0.5, window: int = 50, increase: float = 0.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.increase = increase
+        self.concurrency = float(max(minimum, min(initial, maximum)))
+        self.in_flight = 0
+        self._last_decrease = float('-inf')
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "_AIMDGate":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.concurrency))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Grow the window while the rolling latency stays under target"""
+        self._latencies.append(latency)
+        if sum(self._latencies) / len(self._latencies) <= self.target_latency:
+            self.concurrency = min(self.maximum, self.concurrency + self.increase)
+
+    def record_overload(self, started: float) -> None:
+        """Halve the window after an overload signal from a request sent at ``started`` (monotonic)"""
+        if started < self._last_decrease:
+            return
+        self.concurrency = max(self.minimum, self.concurrency * 0.5)
+        self._last_decrease = time.monotonic()
+
+class ShotcutAPIAsync:
+    """
+    Asynchronous Python client for the Shotcut.in API
+
+    Requires the optional ``aiohttp`` dependency (``pip install shotcut-python[async]``),
+    or ``httpx[http2]`` when created with ``http2=True``.
+    """
+
+    def __init__(self, api_key: str, max_concurrency: int = 128, initial_concurrency: int = 8,
+                 target_latency: float = 0.5, http2: bool = False,
+                 timeout: Tuple[float, float] = (5.0, 30.0)):
+        """
+        Initialize the asynchronous Shotcut API client
+
+        Args:
+            api_key (str): Your Shotcut API key
+            max_concurrency (int): Upper bound on requests in flight at once
+            initial_concurrency (int): Requests allowed in flight before the window adapts
+            target_latency (float): Average latency in seconds under which concurrency grows
+            http2 (bool): Multiplex requests over HTTP/2 using httpx. Falls back to
+                aiohttp (HTTP/1.1) when the "http2" extra is not installed.
+            timeout (tuple): (connect, read) timeouts in seconds for every request
+        """
+        if http2 and httpx is None:
+            warnings.warn("HTTP/2 requires httpx[http2]: pip install shotcut-python[http2]; "
+                          "falling back to HTTP/1.1", RuntimeWarning, stacklevel=2)
+        self._http2 = bool(http2 and httpx is not None)
+        if not self._http2 and aiohttp is None:
+            raise ImportError("ShotcutAPIAsync requires aiohttp: pip install shotcut-python[async]")
+        self.api_key = api_key
+        self.timeout = timeout
+        self._base = "https://shotcut.in/api/"
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self.max_concurrency = max_concurrency
+        self.initial_concurrency = initial_concurrency
+        self.target_latency = target_latency
+        self._session: Optional[Union["aiohttp.ClientSession", "httpx.AsyncClient"]] = None
+        self._gate: Optional[_AIMDGate] = None
+        self._limiter = HeaderRateLimiter()
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the API, without a trailing slash"""
+        return self._base[:-1]
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        # Keep the trailing slash so request URLs are built with a single concatenation
+        self._base = value.rstrip("/") + "/"
+
+    def _get_session(self) -> Tuple[Union["aiohttp.ClientSession", "httpx.AsyncClient"], _AIMDGate]:
+        """Create the HTTP session and its concurrency gate on first use, inside the running event loop"""
+        if self._session is None or self._gate is None:
+            # The gate's Condition belongs to the running loop, so it lives and dies with the session
+            self._gate = _AIMDGate(initial=self.initial_concurrency, maximum=self.max_concurrency,
+                                   target_latency=self.target_latency)
+            if self._http2:
+                self._session = httpx.AsyncClient(
+                    http2=True,
+                    headers=self.headers,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=self.max_concurrency),
+                    timeout=httpx.Timeout(connect=self.timeout[0], read=self.timeout[1],
+                                          write=self.timeout[1], pool=self.timeout[0])
+                )
+            else:
+                connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrency, keepalive_timeout=75)
+                timeout = aiohttp.ClientTimeout(sock_connect=self.timeout[0], sock_read=self.timeout[1])
+                self._session = aiohttp.ClientSession(connector=connector, headers=self.headers, timeout=timeout)
+        return self._session, self._gate
+
+    async def _send(self, session, method: str, url: str, body: Optional[bytes] = None,
+                    params: Optional[Dict] = None):
+        """Send a request on the configured HTTP backend, returning (status, headers, body)"""
+        if self._http2:
+            response = await session.request(method, url, content=body, params=params)
+            return response.status_code, response.headers, response.content
+        async with session.request(method=method, url=url, data=body, params=params) as response:
+            return response.status, response.headers, await response.read()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        if self._session is not None:
+            if httpx is not None and isinstance(self._session, httpx.AsyncClient):
+                await self._session.aclose()
+            else:
+                await self._session.close()
+            self._session = None
+            self._gate = None
+
+    async def __aenter__(self) -> "ShotcutAPIAsync":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None,
+                            body: Optional[bytes] = None) -> Dict:
+        """
+        Make HTTP request to the API
+
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            endpoint (str): API endpoint
+            data (dict, optional): Request body data
+            params (dict, optional): Query parameters
+            body (bytes, optional): Pre-encoded JSON body, used instead of ``data``
+
+        Returns:
+            dict: Response data
+        """
+        url = self._base + endpoint
+        # Content-Type is set once on the session, so send the pre-encoded body as-is
+        if body is None and data:
+            body = dumps_json(data)
+
+        try:
+            session, gate = self._get_session()
+            timeouts = 0
+            for attempt in range(MAX_RETRIES + 1):
+                # Wait for the rate limit window to reset instead of burning a request
+                delay = self._limiter.delay()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                try:
+                    async with gate:
+                        started = time.monotonic()
+                        try:
+                            status, headers, content = await self._send(
+                                session, method, url, body, params if params else None)
+                        except _CONNECTION_ERRORS + _TIMEOUT_ERRORS:
+                            gate.record_overload(started)
+                            raise
+                        self._limiter.update(headers)
+
+                        if status in _BACKOFF_STATUSES:
+                            gate.record_overload(started)
+                        else:
+                            gate.record_success(time.monotonic() - started)
+                except _TIMEOUT_ERRORS as e:
+                    timeouts += 1
+                    if (method not in IDEMPOTENT_METHODS or timeouts > MAX_TIMEOUT_RETRIES
+                            or attempt == MAX_RETRIES):
+                        raise RequestTimeoutError(f"Request timed out: {str(e)}")
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+
+                if status != 429:
+                    break
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+            else:
+                reset_time = datetime.fromtimestamp(self._limiter.reset_ts or 0)
+                raise RateLimitError(f"Rate limit exceeded. Reset at {reset_time}", status_code=429)
+
+            try:
+                response_data = loads_json(content)
+            except ValueError:
+                raise ShotcutAPIError("Invalid JSON in API response", status_code=status)
+
+            # Check for API errors
+            if response_data.get('error') and response_data['error'] != 0:
+                raise ShotcutAPIError(response_data.get('message', 'Unknown API error'),
+                                      status_code=status, response=response_data)
+
+            return response_data
+
+        except _TRANSPORT_ERRORS as e:
+            raise ShotcutAPIError(f"Request failed: {str(e)}")
+
+    async def iterate_all(self, endpoint: str, limit: int = 100, **params) -> AsyncIterator[Dict]:
+        """
+        Iterate over every page of a paginated endpoint
+
+        The first page is fetched to learn the page count, then the remaining
+        pages are fetched concurrently.
+
+        Args:
+            endpoint (str): Paginated API endpoint, e.g. "urls" or "campaigns"
+            limit (int): Items per page
+            **params: Extra query parameters sent with every page
+
+        Yields:
+            dict: Response data for each page, in page order
+        """
+        first = await self._make_request("GET", endpoint, params={**params, 'limit': limit, 'page': 1})
+        yield first
+
+        total_pages = get_total_pages(first)
+        if total_pages < 2:
+            return
+
+        pages = await asyncio.gather(*[
+            self._make_request("GET", endpoint, params={**params, 'limit': limit, 'page': page})
+            for page in range(2, total_pages + 1)
+        ])
+        for page in pages:
+            yield page
+
+    async def _gather_with_retry(self, calls: Sequence[Callable[[], Awaitable[Dict]]]) -> List[Dict]:
+        """
+        Run independent API calls concurrently
+
+        Calls that fail with ShotcutAPIError are retried once after the batch
+        completes. Calls that still fail are reported together in a
+        BulkRequestError that carries the completed results.
+
+        Returns:
+            list: Results in the same order as ``calls``
+        """
+        results: List[Any] = await asyncio.gather(*[call() for call in calls], return_exceptions=True)
+        failed = _api_failures(results)
+        retried = await asyncio.gather(*[calls[index]() for index in failed], return_exceptions=True)
+        for index, result in zip(failed, retried):
+            results[index] = result
+        failed = _api_failures(results)
+        if failed:
+            raise BulkRequestError(f"{len(failed)} of {len(calls)} requests failed", results=results)
+        return results
+
+    # Account Methods
+    async def update_account(self, email: Optional[str] = None, password: Optional[str] = None) -> Dict:
+        """Update account information"""
+        data = clean_params({'email': email, 'password': password})
+        return await self._make_request("PUT", "account/update", data=data)
+
+    # Branded Domains Methods
+    async def create_domain(self, domain: str, redirect_root: Optional[str] = None, redirect_404: Optional[str] = None) -> Dict:
+        """Create a branded domain"""
+        data = {
+            'domain': domain,
+            'redirectroot': redirect_root,
+            'redirect404': redirect_404
+        }
+        return await self._make_request("POST", "domain/add", data=data)
+
+    async def update_domain(self, domain_id: int, redirect_root: Optional[str] = None, redirect_404: Optional[str] = None) -> Dict:
+        """Update a branded domain"""
+        data = clean_params({'redirectroot': redirect_root, 'redirect404': redirect_404})
+        endpoint = endpoint_path("domain/{domain_id}/update", domain_id=domain_id)
+        return await self._make_request("PUT", endpoint, data=data)
+
+    # Campaigns Methods
+    async def create_campaign(self, name: str, slug: Optional[str] = None, public: bool = False) -> Dict:
+        """Create a campaign"""
+        data = {
+            'name': name,
+            'slug': slug,
+            'public': public
+        }
+        return await self._make_request("POST", "campaign/add", data=data)
+
+    async def update_campaign(self, campaign_id: int, name: str, slug: Optional[str] = None, public: Optional[bool] = None) -> Dict:
+        """Update a campaign"""
+        data = clean_params({'name': name, 'slug': slug, 'public': public})
+        endpoint = endpoint_path("campaign/{campaign_id}/update", campaign_id=campaign_id)
+        return await self._make_request("PUT", endpoint, data=data)
+
+    async def assign_links_to_campaign(self, campaign_id: int, link_ids: List[int]) -> List[Dict]:
+        """Assign several links to a campaign concurrently, returning results in the order of ``link_ids``"""
+        return await self._gather_with_retry([
+            partial(self.assign_link_to_campaign, campaign_id, link_id) for link_id in link_ids
+        ])
+
+    # Channels Methods
+    async def create_channel(self, name: str, description: Optional[str] = None,
+                             color: Optional[str] = None, starred: bool = False) -> Dict:
+        """Create a channel"""
+        data = {
+            'name': name,
+            'description': description,
+            'color': color,
+            'starred': starred
+        }
+        return await self._make_request("POST", "channel/add", data=data)
+
+    async def update_channel(self, channel_id: int, name: Optional[str] = None,
+                             description: Optional[str] = None, color: Optional[str] = None,
+                             starred: Optional[bool] = None) -> Dict:
+        """Update a channel"""
+        data = clean_params({
+            'name': name,
+            'description': description,
+            'color': color,
+            'starred': starred
+        })
+        endpoint = endpoint_path("channel/{channel_id}/update", channel_id=channel_id)
+        return await self._make_request("PUT", endpoint, data=data)
+
+    async def assign_items_to_channel(self, channel_id: int, items: List[Tuple[str, int]]) -> List[Dict]:
+        """Assign several (item_type, item_id) pairs to a channel concurrently, returning results in order"""
+        return await self._gather_with_retry([
+            partial(self.assign_item_to_channel, channel_id, item_type, item_id) for item_type, item_id in items
+        ])
+
+    # Links Methods
+    async def get_links_bulk(self, ids: List[int]) -> List[Dict]:
+        """Get several links concurrently, returned in the order of ``ids``"""
+        return await asyncio.gather(*[self.get_link(i) for i in ids])
+
+    async def shorten_link(self, url: str, **kwargs) -> Dict:
+        """
+        Shorten a link with optional parameters
+
+        Args:
+            url (str): URL to shorten
+            **kwargs: Optional parameters (custom, type, password, domain, expiry, etc.)
+        """
+        data = {'url': url, **kwargs}
+        return await self._make_request("POST", "url/add", data=data)
+
+    async def shorten_links_bulk(self, urls: List[str], **common_kwargs) -> List[Dict]:
+        """
+        Shorten many URLs that share the same options, concurrently
+
+        The shared options are JSON-encoded once and only the URL is encoded
+        per request. Failed requests are not retried, since repeating a
+        shortening request could create duplicate links; if any fail, a
+        BulkRequestError is raised whose ``results`` hold each response or
+        error in the order of ``urls``.
+
+        Args:
+            urls (list): URLs to shorten
+            **common_kwargs: Optional parameters applied to every link (custom, type, domain, expiry, etc.)
+
+        Returns:
+            list: Responses in the same order as ``urls``
+        """
+        encode = make_url_body_encoder(common_kwargs)
+        results: List[Any] = await asyncio.gather(
+            *[self._make_request("POST", "url/add", body=encode(url)) for url in urls], return_exceptions=True)
+        failed = _api_failures(results)
+        if failed:
+            raise BulkRequestError(f"{len(failed)} of {len(urls)} requests failed", results=results)
+        return results
+
+    async def update_link(self, link_id: int, **kwargs) -> Dict:
+        """Update a link"""
+        endpoint = endpoint_path("url/{link_id}/update", link_id=link_id)
+        return await self._make_request("PUT", endpoint, data=kwargs)
+
+    # Pixels Methods
+    async def create_pixel(self, type: str, name: str, tag: str) -> Dict:
+        """Create a pixel"""
+        data = {
+            'type': type,
+            'name': name,
+            'tag': tag
+        }
+        return await self._make_request("POST", "pixel/add", data=data)
+
+    async def update_pixel(self, pixel_id: int, name: Optional[str] = None, tag: Optional[str] = None) -> Dict:
+        """Update a pixel"""
+        data = clean_params({'name': name, 'tag': tag})
+        endpoint = endpoint_path("pixel/{pixel_id}/update", pixel_id=pixel_id)
+        return await self._make_request("PUT", endpoint, data=data)
+
+    # QR Codes Methods
+    async def create_qr_code(self, type: str, data: Union[str, Dict],
+                             background: Optional[str] = None,
+                             foreground: Optional[str] = None,
+                             logo: Optional[str] = None) -> Dict:
+        """Create a QR code"""
+        qr_data = {
+            'type': type,
+            'data': data
+        }
+        if background:
+            qr_data['background'] = background
+        if foreground:
+            qr_data['foreground'] = foreground
+        if logo:
+            qr_data['logo'] = logo
+        return await self._make_request("POST", "qr/add", data=qr_data)
+
+    async def update_qr_code(self, qr_id: int, data: Union[str, Dict],
+                             background: Optional[str] = None,
+                             foreground: Optional[str] = None,
+                             logo: Optional[str] = None) -> Dict:
+        """Update a QR code"""
+        qr_data = clean_params({
+            'data': data,
+            'background': background,
+            'foreground': foreground,
+            'logo': logo
+        })
+        endpoint = endpoint_path("qr/{qr_id}/update", qr_id=qr_id)
+        return await self._make_request("PUT", endpoint, data=qr_data)
+
+    if TYPE_CHECKING:
+        # Signatures of the methods install_endpoints() generates from ENDPOINTS, declared
+        # for type checkers and IDEs; tests/test_endpoints.py checks they stay in sync
+        # Account
+        async def get_account(self) -> Dict: ...
+        # Branded Domains
+        async def list_domains(self, limit: int = 10, page: int = 1) -> Dict: ...
+        async def delete_domain(self, domain_id: int) -> Dict: ...
+        # CTA Overlays
+        async def list_overlays(self, limit: int = 10, page: int = 1) -> Dict: ...
+        # Campaigns
+        async def list_campaigns(self, limit: int = 10, page: int = 1) -> Dict: ...
+        async def assign_link_to_campaign(self, campaign_id: int, link_id: int) -> Dict: ...
+        async def delete_campaign(self, campaign_id: int) -> Dict: ...
+        # Channels
+        async def list_channels(self, limit: int = 10, page: int = 1) -> Dict: ...
+        async def list_channel_items(self, channel_id: int, limit: int = 10, page: int = 1) -> Dict: ...
+        async def assign_item_to_channel(self, channel_id: int, item_type: str, item_id: int) -> Dict: ...
+        async def delete_channel(self, channel_id: int) -> Dict: ...
+        # Custom Splash
+        async def list_splash(self, limit: int = 10, page: int = 1) -> Dict: ...
+        # Links
+        async def list_links(self, limit: int = 10, page: int = 1,
+                             order: str = 'date', short: Optional[str] = None) -> Dict: ...
+        async def get_link(self, link_id: int) -> Dict: ...
+        async def delete_link(self, link_id: int) -> Dict: ...
+        # Pixels
+        async def list_pixels(self, limit: int = 10, page: int = 1) -> Dict: ...
+        async def delete_pixel(self, pixel_id: int) -> Dict: ...
+        # QR Codes
+        async def list_qr_codes(self, limit: int = 10, page: int = 1) -> Dict: ...
+        async def get_qr_code(self, qr_id: int) -> Dict: ...
+        async def delete_qr_code(self, qr_id: int) -> Dict: ...
+
+# Methods that map onto a single request (list_*, get_*, delete_*, assign_*)
+# are generated from the table in shotcut.endpoints
+install_endpoints(ShotcutAPIAsync, is_async=True)
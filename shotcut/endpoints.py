@@ -0,0 +1,105 @@
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .utils import clean_params, endpoint_path
+
+
+class Endpoint(NamedTuple):
+    """Declarative description of an API method that maps directly onto one request"""
+    name: str
+    verb: str
+    template: str
+    path: Tuple[Tuple[str, str], ...] = ()
+    query: Tuple[Tuple[str, str, object], ...] = ()
+    doc: str = ""
+
+_PAGINATION = (('limit', 'int', 10), ('page', 'int', 1))
+
+# Methods whose body is nothing more than one request. Path parameters are
+# (name, annotation) pairs, query parameters are (name, annotation, default).
+ENDPOINTS = (
+    # Account
+    Endpoint("get_account", "GET", "account", doc="Get account information"),
+    # Branded Domains
+    Endpoint("list_domains", "GET", "domains", query=_PAGINATION, doc="List branded domains"),
+    Endpoint("delete_domain", "DELETE", "domain/{domain_id}/delete", path=(('domain_id', 'int'),),
+             doc="Delete a branded domain"),
+    # CTA Overlays
+    Endpoint("list_overlays", "GET", "overlay", query=_PAGINATION, doc="List CTA overlays"),
+    # Campaigns
+    Endpoint("list_campaigns", "GET", "campaigns", query=_PAGINATION, doc="List campaigns"),
+    Endpoint("assign_link_to_campaign", "POST", "campaign/{campaign_id}/assign/{link_id}",
+             path=(('campaign_id', 'int'), ('link_id', 'int')), doc="Assign a link to a campaign"),
+    Endpoint("delete_campaign", "DELETE", "campaign/{campaign_id}/delete", path=(('campaign_id', 'int'),),
+             doc="Delete a campaign"),
+    # Channels
+    Endpoint("list_channels", "GET", "channels", query=_PAGINATION, doc="List channels"),
+    Endpoint("list_channel_items", "GET", "channel/{channel_id}", path=(('channel_id', 'int'),),
+             query=_PAGINATION, doc="List items in a channel"),
+    Endpoint("assign_item_to_channel", "POST", "channel/{channel_id}/assign/{item_type}/{item_id}",
+             path=(('channel_id', 'int'), ('item_type', 'str'), ('item_id', 'int')),
+             doc="Assign an item to a channel"),
+    Endpoint("delete_channel", "DELETE", "channel/{channel_id}/delete", path=(('channel_id', 'int'),),
+             doc="Delete a channel"),
+    # Custom Splash
+    Endpoint("list_splash", "GET", "splash", query=_PAGINATION, doc="List custom splash pages"),
+    # Links
+    Endpoint("list_links", "GET", "urls",
+             query=_PAGINATION + (('order', 'str', 'date'), ('short', 'Optional[str]', None)), doc="List links"),
+    Endpoint("get_link", "GET", "url/{link_id}", path=(('link_id', 'int'),), doc="Get a single link"),
+    Endpoint("delete_link", "DELETE", "url/{link_id}/delete", path=(('link_id', 'int'),), doc="Delete a link"),
+    # Pixels
+    Endpoint("list_pixels", "GET", "pixels", query=_PAGINATION, doc="List pixels"),
+    Endpoint("delete_pixel", "DELETE", "pixel/{pixel_id}/delete", path=(('pixel_id', 'int'),),
+             doc="Delete a pixel"),
+    # QR Codes
+    Endpoint("list_qr_codes", "GET", "qr", query=_PAGINATION, doc="List QR codes"),
+    Endpoint("get_qr_code", "GET", "qr/{qr_id}", path=(('qr_id', 'int'),), doc="Get a single QR code"),
+    Endpoint("delete_qr_code", "DELETE", "qr/{qr_id}/delete", path=(('qr_id', 'int'),), doc="Delete a QR code"),
+)
+
+def _make_method(cls: type, endpoint: Endpoint, is_async: bool):
+    """
+    Compile a method for one endpoint
+
+    The verb, endpoint template and query keys are baked into the generated
+    source, so each method is a single call into ``_make_request`` with the
+    real signature, like a hand-written one. Path templates are filled in by
+    utils.endpoint_path, the same cached helper the hand-written methods use.
+    """
+    args = ["self"]
+    args += [f"{name}: {annotation}" for name, annotation in endpoint.path]
+    args += [f"{name}: {annotation} = {default!r}" for name, annotation, default in endpoint.query]
+
+    if endpoint.path:
+        ids = ", ".join(f"{name}={name}" for name, _ in endpoint.path)
+        target = f"endpoint_path({endpoint.template!r}, {ids})"
+    else:
+        target = repr(endpoint.template)
+
+    call = f"self._make_request({endpoint.verb!r}, {target}"
+    if endpoint.query:
+        params = "{" + ", ".join(f"{name!r}: {name}" for name, _, _ in endpoint.query) + "}"
+        if any(default is None for _, _, default in endpoint.query):
+            params = f"clean_params({params})"
+        call += f", params={params}"
+    call += ")"
+
+    lines = [
+        f"{'async ' if is_async else ''}def {endpoint.name}({', '.join(args)}) -> Dict:",
+        f"    return {'await ' if is_async else ''}{call}",
+    ]
+
+    namespace: Dict[str, Any] = {'Dict': Dict, 'Optional': Optional,
+                                 'clean_params': clean_params, 'endpoint_path': endpoint_path}
+    exec("\n".join(lines), namespace)
+    method = namespace[endpoint.name]
+    method.__doc__ = endpoint.doc
+    method.__module__ = cls.__module__
+    method.__qualname__ = f"{cls.__qualname__}.{endpoint.name}"
+    return method
+
+def install_endpoints(cls: type, is_async: bool = False) -> type:
+    """Attach a generated method for every entry in ENDPOINTS to a client class"""
+    for endpoint in ENDPOINTS:
+        setattr(cls, endpoint.name, _make_method(cls, endpoint, is_async))
+    return cls
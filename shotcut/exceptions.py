@@ -10,6 +10,22 @@ class RateLimitError(ShotcutAPIError):
     """Raised when API rate limit is exceeded"""
     pass
 
+class RequestTimeoutError(ShotcutAPIError):
+    """Raised when the API does not connect or respond within the configured timeout"""
+    pass
+
+class BulkRequestError(ShotcutAPIError):
+    """
+    Raised when some requests of a bulk call fail
+
+    ``results`` holds the response or the ShotcutAPIError of every request, in
+    the order of the bulk call's input, so completed requests are not lost.
+    """
+
+    def __init__(self, message: str, results: list):
+        super().__init__(message)
+        self.results = results
+
 class AuthenticationError(ShotcutAPIError):
     """Raised when API key is invalid or missing"""
     pass
@@ -1,15 +1,35 @@
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Union
+import re
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple, Type, TypeVar, Union
 
-@dataclass
+# The only layout the API uses. It is checked up front so results do not depend on
+# which parser is installed (ciso8601 would also accept dates, "T" and offsets)
+_DATETIME_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}')
+
+def _slice_datetime(date_str: str) -> datetime:
+    """Parse a validated "YYYY-MM-DD HH:MM:SS" string by slicing instead of strptime"""
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                    int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+
+try:
+    from ciso8601 import parse_datetime_as_naive as _parse_datetime
+except ImportError:  # pragma: no cover - optional dependency
+    _parse_datetime = _slice_datetime  # type: ignore[assignment]
+
+# Slotted models drop the per-instance __dict__; dataclass(slots=True) needs Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class BaseModel:
     """Base model with common fields"""
     id: int
     created_at: datetime
     updated_at: datetime
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Link(BaseModel):
     """Model for shortened URL links"""
     url: str
@@ -23,7 +43,7 @@ class Link(BaseModel):
     clicks: int = 0
     status: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Campaign(BaseModel):
     """Model for campaigns"""
     name: str
@@ -32,7 +52,7 @@ class Campaign(BaseModel):
     total_links: int = 0
     total_clicks: int = 0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Channel(BaseModel):
     """Model for channels"""
     name: str
@@ -41,7 +61,7 @@ class Channel(BaseModel):
     starred: bool = False
     total_items: int = 0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Domain(BaseModel):
     """Model for branded domains"""
     domain: str
@@ -50,7 +70,7 @@ class Domain(BaseModel):
     redirect_404: Optional[str] = None
     ssl_status: bool = False
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Pixel(BaseModel):
     """Model for tracking pixels"""
     type: str
@@ -58,7 +78,7 @@ class Pixel(BaseModel):
     tag: str
     status: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class QRCode(BaseModel):
     """Model for QR codes"""
     type: str
@@ -68,14 +88,14 @@ class QRCode(BaseModel):
     foreground: Optional[str] = None
     logo: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Splash(BaseModel):
     """Model for splash pages"""
     name: str
     content: str
     status: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AccountStats:
     """Model for account statistics"""
     total_links: int
@@ -86,7 +106,7 @@ class AccountStats:
     total_pixels: int
     total_qr_codes: int
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PaginatedResponse:
     """Model for paginated API responses"""
     items: List[Union[Link, Campaign, Channel, Domain, Pixel, QRCode, Splash]]
@@ -96,19 +116,47 @@ class PaginatedResponse:
     has_next: bool
     has_prev: bool
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class APIResponse:
     """Model for standard API responses"""
     error: int
     message: Optional[str] = None
     data: Optional[Union[Dict, List, BaseModel, PaginatedResponse]] = None
 
+M = TypeVar('M')
+
+# Datetime fields to convert for each model, resolved once rather than per record
+_DT_FIELDS: Dict[type, Tuple[str, ...]] = {
+    Link: ('created_at', 'updated_at', 'expiry'),
+    Campaign: ('created_at', 'updated_at'),
+    Channel: ('created_at', 'updated_at'),
+    Domain: ('created_at', 'updated_at'),
+    Pixel: ('created_at', 'updated_at'),
+    QRCode: ('created_at', 'updated_at'),
+    Splash: ('created_at', 'updated_at'),
+    AccountStats: (),
+}
+
+# Declared field names per model; keys the API adds later are dropped instead of failing hydration
+_FIELDS: Dict[type, FrozenSet[str]] = {
+    cls: frozenset(field.name for field in fields(cls))
+    for cls in (Link, Campaign, Channel, Domain, Pixel, QRCode, Splash, AccountStats)
+}
+
+def _model_fields(model_class: type) -> frozenset:
+    """Field names accepted by a model class, cached per class"""
+    names = _FIELDS.get(model_class)
+    if names is None:
+        names = _FIELDS[model_class] = frozenset(field.name for field in fields(model_class))
+    return names
+
+@lru_cache(maxsize=4096)
 def convert_datetime(date_str: Optional[str]) -> Optional[datetime]:
     """Convert datetime string to datetime object"""
-    if not date_str:
+    if not date_str or not _DATETIME_RE.fullmatch(date_str):
         return None
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        return _parse_datetime(date_str)
     except ValueError:
         return None
 
@@ -124,8 +172,26 @@ def create_model_from_response(model_class: type, data: Dict) -> Union[BaseModel
         data['updated_at'] = convert_datetime(data['updated_at'])
     if 'expiry' in data:
         data['expiry'] = convert_datetime(data['expiry'])
-        
+
+    # Only missing required fields can still fail here
+    names = _model_fields(model_class)
+    try:
+        return model_class(**{key: value for key, value in data.items() if key in names})
+    except TypeError as e:
+        raise ValueError(f"Invalid data for {model_class.__name__}: {str(e)}")
+
+def hydrate_page(model_class: Type[M], rows: List[Dict]) -> List[M]:
+    """Create model instances for a whole page of API records in one pass"""
+    dt_fields = _DT_FIELDS.get(model_class, ('created_at', 'updated_at'))
+    names = _model_fields(model_class)
+    parse = convert_datetime
     try:
-        return model_class(**data)
+        return [
+            model_class(**{
+                key: parse(value) if key in dt_fields else value
+                for key, value in row.items() if key in names
+            })
+            for row in rows
+        ]
     except TypeError as e:
-        raise ValueError(f"Invalid data for {model_class.__name__}: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Invalid data for {model_class.__name__}: {str(e)}")
@@ -0,0 +1,75 @@
+import time
+from typing import Mapping, Optional
+
+# Retry policy for HTTP 429 responses
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+# Timed-out requests are only retried when repeating them is safe
+MAX_TIMEOUT_RETRIES = 2
+IDEMPOTENT_METHODS = frozenset(["GET", "PUT", "DELETE"])
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff delay in seconds for the given retry attempt (0-based)"""
+    return min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt))
+
+class HeaderRateLimiter:
+    """
+    Proactive rate limiter driven by the X-RateLimit-* response headers
+
+    After every response the limiter records the advertised limit, the remaining
+    quota and the reset timestamp. Before the next request it tells the caller to
+    wait until the window resets once the remaining quota drops to the threshold,
+    instead of spending a round-trip on a request that is bound to be rejected.
+    """
+
+    def __init__(self, min_remaining: int = 2, threshold: float = 0.1):
+        """
+        Args:
+            min_remaining (int): Always keep at least this many requests in reserve
+            threshold (float): Fraction of the limit to keep in reserve
+        """
+        self.min_remaining = min_remaining
+        self.threshold = threshold
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_ts: Optional[float] = None
+        # Raw header values last parsed, so unchanged ones are not converted again
+        self._limit_raw: Optional[str] = None
+        self._reset_raw: Optional[str] = None
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the rate limit state advertised by a response"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            # Responses without rate limit headers leave the state untouched
+            return
+        try:
+            self.remaining = int(remaining)
+            # The limit and reset timestamp stay the same for a whole window
+            limit = headers.get('X-RateLimit-Limit')
+            if limit is not None and limit != self._limit_raw:
+                self.limit = int(limit)
+                self._limit_raw = limit
+            reset = headers.get('X-RateLimit-Reset')
+            if reset is not None and reset != self._reset_raw:
+                self.reset_ts = float(reset)
+                self._reset_raw = reset
+        except ValueError:
+            pass
+
+    def delay(self) -> float:
+        """Seconds to wait before the next request may be sent"""
+        if self.remaining is None or self.reset_ts is None:
+            return 0.0
+        reserve = max(self.min_remaining, self.threshold * (self.limit or 0))
+        if self.remaining > reserve:
+            return 0.0
+        return max(0.0, self.reset_ts - time.time())
+
+    def wait_if_throttled(self) -> None:
+        """Block until the current window resets if the quota is nearly exhausted"""
+        delay = self.delay()
+        if delay > 0:
+            time.sleep(delay)
@@ -1,5 +1,44 @@
-from typing import Optional, Dict, Any
+import json
+import re
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+_RGB_RE = re.compile(r'rgb\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)')
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to a JSON request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+_URL_PLACEHOLDER = "\x00shotcut-url\x00"
+
+def make_url_body_encoder(common: Dict[str, Any]) -> Callable[[str], bytes]:
+    """
+    Build an encoder for ``{'url': url, **common}`` request bodies
+
+    The shared fields are serialized once; each call only encodes the URL and
+    splices it into the pre-encoded template.
+    """
+    placeholder = dumps_json(_URL_PLACEHOLDER)
+    template = dumps_json({'url': _URL_PLACEHOLDER, **common})
+    if template.count(placeholder) != 1:
+        # The placeholder was not emitted exactly once; encode each body in full
+        return lambda url: dumps_json({**common, 'url': url})
+    head, tail = template.split(placeholder)
+    return lambda url: head + dumps_json(url) + tail
+
+def loads_json(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 def validate_date(date_str: Optional[str]) -> bool:
     """Validate date string format"""
@@ -15,16 +54,28 @@ def clean_params(params: Dict[str, Any]) -> Dict[str, Any]:
     """Remove None values from params dictionary"""
     return {k: v for k, v in params.items() if v is not None}
 
+@lru_cache(maxsize=1024)
+def endpoint_path(template: str, **ids: Any) -> str:
+    """Fill an endpoint path template such as "url/{link_id}", cached since the same ids recur"""
+    return template.format(**ids)
+
+def get_total_pages(response: Dict[str, Any]) -> int:
+    """Read the page count from a paginated response, defaulting to a single page"""
+    total_pages = response.get('total_pages')
+    if total_pages is None and isinstance(response.get('data'), dict):
+        total_pages = response['data'].get('total_pages')
+    if total_pages is None:
+        return 1
+    try:
+        return max(1, int(total_pages))
+    except (TypeError, ValueError):
+        return 1
+
 def validate_rgb_color(color: Optional[str]) -> bool:
     """Validate RGB color format"""
     if not color:
         return True
-    if not color.startswith("rgb(") or not color.endswith(")"):
-        return False
-    try:
-        values = color[4:-1].split(",")
-        if len(values) != 3:
-            return False
-        return all(0 <= int(v.strip()) <= 255 for v in values)
-    except ValueError:
+    match = _RGB_RE.fullmatch(color)
+    if match is None:
         return False
+    return all(int(value) <= 255 for value in match.groups())
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+import shotcut.api
+import shotcut.async_api
+from shotcut import ShotcutAPI, ShotcutAPIAsync
+
+
+class FakeShotcut:
+    """
+    Local stand-in for the Shotcut API
+
+    Every request is recorded as (method, path, query, body) and answered by
+    ``handler``, which returns (status, payload) or (status, payload, headers).
+    The default handler echoes the request back with error 0.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.handler = self.echo
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True).start()
+        self.base_url = "http://127.0.0.1:%d/api" % self._server.server_address[1]
+
+    @staticmethod
+    def echo(method, path, query, body):
+        return 200, {'error': 0, 'method': method, 'path': path, 'query': query, 'body': body}
+
+    def count(self, path=None):
+        """Number of requests received, optionally only those for one API path"""
+        with self._lock:
+            return sum(1 for request in self.requests if path is None or request[1] == path)
+
+    def respond_slowly(self, seconds, status=200, payload=None):
+        """Answer every request after a delay, to trip read timeouts"""
+        def handler(method, path, query, body):
+            time.sleep(seconds)
+            return status, payload if payload is not None else {'error': 0}
+        self.handler = handler
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                parsed = urlparse(self.path)
+                path = parsed.path[len('/api/'):]
+                query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+                body = json.loads(raw) if raw else None
+                with fake._lock:
+                    fake.requests.append((self.command, path, query, body))
+                status, payload, *rest = fake.handler(self.command, path, query, body)
+                headers = rest[0] if rest else {}
+                content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(content)))
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(content)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on a deliberately slow response
+                    pass
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        return Handler
+
+@pytest.fixture
+def server():
+    fake = FakeShotcut()
+    yield fake
+    fake.close()
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry immediately so retry paths do not slow the suite down"""
+    monkeypatch.setattr(shotcut.api, 'backoff_delay', lambda attempt: 0)
+    monkeypatch.setattr(shotcut.async_api, 'backoff_delay', lambda attempt: 0)
+
+@pytest.fixture
+def make_api(server):
+    """Build ShotcutAPI clients pointed at the fake server"""
+    clients = []
+
+    def factory(**kwargs):
+        api = ShotcutAPI("test-key", **kwargs)
+        api.base_url = server.base_url
+        if isinstance(api._session, requests.Session):
+            # Talk to the plain-HTTP server through the same adapter production uses
+            api._session.mount("http://", api._session.get_adapter("https://"))
+        clients.append(api)
+        return api
+
+    yield factory
+    for api in clients:
+        api.close()
+
+@pytest.fixture
+def run_async(server):
+    """Run coroutine_fn(api) with a ShotcutAPIAsync client on the fake server, in a fresh event loop"""
+    def runner(coroutine_fn, **kwargs):
+        async def main():
+            async with ShotcutAPIAsync("test-key", **kwargs) as api:
+                api.base_url = server.base_url
+                return await coroutine_fn(api)
+        return asyncio.run(main())
+    return runner
@@ -0,0 +1,108 @@
+import socket
+import time
+
+import pytest
+import urllib3.util.connection
+
+from shotcut import (RateLimitError, RequestTimeoutError, ShotcutAPI,
+                     ShotcutAPIError)
+from shotcut.ratelimit import MAX_RETRIES, MAX_TIMEOUT_RETRIES
+
+
+def test_request_sends_json_body_and_query(server, make_api):
+    api = make_api()
+    assert api.update_channel(3, name="Sales")['body'] == {'name': "Sales"}
+    assert api.list_links(limit=5)['query'] == {'limit': '5', 'page': '1', 'order': 'date'}
+
+def test_requests_share_one_session_until_the_client_is_closed(server, monkeypatch):
+    closed = []
+    with ShotcutAPI("test-key") as api:
+        api.base_url = server.base_url
+        session = api._session
+        close = session.close
+        monkeypatch.setattr(session, 'close', lambda: closed.append(close()))
+        api.get_account()
+        api.get_account()
+        assert api._session is session and not closed
+    assert len(closed) == 1
+
+def test_base_url_is_stored_without_a_trailing_slash():
+    api = ShotcutAPI("test-key")
+    assert api.base_url == "https://shotcut.in/api"
+    api.base_url = "https://example.com/api//"
+    assert api.base_url == "https://example.com/api"
+    api.close()
+
+def test_base_url_with_a_trailing_slash_builds_the_same_urls(server, make_api):
+    api = make_api()
+    api.base_url = server.base_url + "/"
+    assert api.get_account()['path'] == "account"
+
+@pytest.mark.parametrize('max_workers, maxsize', [(8, 64), (100, 100)])
+def test_connection_pool_fits_the_bulk_helpers(max_workers, maxsize):
+    with ShotcutAPI("test-key", max_workers=max_workers) as api:
+        pool = api._session.get_adapter("https://shotcut.in/api/").poolmanager.connection_pool_kw
+    # Blocking keeps extra threads waiting for a pooled connection instead of opening throwaway ones
+    assert pool['maxsize'] == maxsize and pool['block'] is True
+
+def test_api_error_is_raised(server, make_api):
+    server.handler = lambda *request: (200, {'error': 1, 'message': "Invalid API key"})
+    with pytest.raises(ShotcutAPIError, match="Invalid API key"):
+        make_api().get_account()
+
+def test_429_is_retried_until_it_succeeds(server, make_api):
+    responses = [429, 429, 200]
+    server.handler = lambda *request: (responses.pop(0), {'error': 0})
+    assert make_api().get_account() == {'error': 0}
+    assert server.count() == 3
+
+def test_429_raises_after_max_retries(server, make_api):
+    server.handler = lambda *request: (429, {'error': 1, 'message': "slow down"})
+    with pytest.raises(RateLimitError):
+        make_api().get_account()
+    assert server.count() == MAX_RETRIES + 1
+
+def test_throttled_client_waits_for_the_window_to_reset(server, make_api):
+    reset = time.time() + 0.3
+    server.handler = lambda *request: (200, {'error': 0}, {
+        'X-RateLimit-Remaining': '0', 'X-RateLimit-Limit': '100', 'X-RateLimit-Reset': str(reset)})
+    api = make_api()
+    api.get_account()
+    api.get_account()
+    assert time.time() >= reset
+
+def test_read_timeout_on_post_is_not_retried(server, make_api):
+    server.respond_slowly(0.5)
+    with pytest.raises(RequestTimeoutError):
+        make_api(timeout=(1.0, 0.1)).shorten_link("https://example.com")
+    assert server.count() == 1
+
+def test_read_timeout_on_get_is_retried(server, make_api):
+    server.respond_slowly(0.5)
+    with pytest.raises(RequestTimeoutError):
+        make_api(timeout=(1.0, 0.1)).get_account()
+    assert server.count() == MAX_TIMEOUT_RETRIES + 1
+
+def test_connect_timeout_is_retried_only_by_the_client(server, make_api, monkeypatch):
+    attempts = []
+
+    def refuse(*args, **kwargs):
+        attempts.append(args)
+        raise socket.timeout("timed out")
+
+    monkeypatch.setattr(urllib3.util.connection, 'create_connection', refuse)
+    with pytest.raises(RequestTimeoutError):
+        make_api(timeout=(0.1, 1.0)).get_account()
+    assert len(attempts) == MAX_TIMEOUT_RETRIES + 1
+
+def test_connect_timeout_on_post_is_not_retried(server, make_api, monkeypatch):
+    attempts = []
+
+    def refuse(*args, **kwargs):
+        attempts.append(args)
+        raise socket.timeout("timed out")
+
+    monkeypatch.setattr(urllib3.util.connection, 'create_connection', refuse)
+    with pytest.raises(RequestTimeoutError):
+        make_api(timeout=(0.1, 1.0)).shorten_link("https://example.com")
+    assert len(attempts) == 1
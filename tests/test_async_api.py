@@ -0,0 +1,47 @@
+import pytest
+
+from shotcut import RateLimitError, RequestTimeoutError, ShotcutAPIAsync
+from shotcut.async_api import aiohttp
+from shotcut.ratelimit import MAX_RETRIES, MAX_TIMEOUT_RETRIES
+
+pytestmark = pytest.mark.skipif(aiohttp is None, reason="requires the async extra")
+
+def test_429_is_retried_until_it_succeeds(server, run_async):
+    responses = [429, 200]
+    server.handler = lambda *request: (responses.pop(0), {'error': 0})
+    assert run_async(lambda api: api.get_account()) == {'error': 0}
+    assert server.count() == 2
+
+def test_429_raises_after_max_retries(server, run_async):
+    server.handler = lambda *request: (429, {'error': 1, 'message': "slow down"})
+    with pytest.raises(RateLimitError):
+        run_async(lambda api: api.get_account())
+    assert server.count() == MAX_RETRIES + 1
+
+def test_read_timeout_on_get_is_retried(server, run_async):
+    server.respond_slowly(0.5)
+    with pytest.raises(RequestTimeoutError):
+        run_async(lambda api: api.get_account(), timeout=(1.0, 0.1))
+    assert server.count() == MAX_TIMEOUT_RETRIES + 1
+
+def test_read_timeout_on_post_is_not_retried(server, run_async):
+    server.respond_slowly(0.5)
+    with pytest.raises(RequestTimeoutError):
+        run_async(lambda api: api.shorten_link("https://example.com"), timeout=(1.0, 0.1))
+    assert server.count() == 1
+
+def test_get_links_bulk_keeps_order(server, run_async):
+    results = run_async(lambda api: api.get_links_bulk([3, 1, 2]))
+    assert [result['path'] for result in results] == ["url/3", "url/1", "url/2"]
+
+def test_base_url_is_stored_without_a_trailing_slash():
+    api = ShotcutAPIAsync("test-key")
+    assert api.base_url == "https://shotcut.in/api"
+    api.base_url = "https://example.com/api//"
+    assert api.base_url == "https://example.com/api"
+
+def test_base_url_with_a_trailing_slash_builds_the_same_urls(server, run_async):
+    async def get_account(api):
+        api.base_url = server.base_url + "/"
+        return await api.get_account()
+    assert run_async(get_account)['path'] == "account"
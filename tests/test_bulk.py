@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from shotcut import BulkRequestError, ShotcutAPIError
+from shotcut.async_api import aiohttp
+from shotcut.utils import make_url_body_encoder
+
+needs_aiohttp = pytest.mark.skipif(aiohttp is None, reason="requires the async extra")
+
+def fail_first_attempt(failing_id):
+    """Handler that rejects the first assignment of ``failing_id`` and accepts everything else"""
+    failed = set()
+
+    def handler(method, path, query, body):
+        item_id = path.rsplit("/", 1)[1]
+        if item_id == failing_id and item_id not in failed:
+            failed.add(item_id)
+            return 200, {'error': 1, 'message': "try again"}
+        return 200, {'error': 0, 'item': item_id}
+    return handler
+
+def test_bulk_assign_keeps_order_and_retries_failures_once(server, make_api):
+    server.handler = fail_first_attempt("3")
+    results = make_api().assign_links_to_campaign(9, [1, 2, 3, 4])
+    assert [result['item'] for result in results] == ["1", "2", "3", "4"]
+    assert server.count("campaign/9/assign/3") == 2
+
+def test_bulk_channel_assign_hits_each_item(server, make_api):
+    results = make_api().assign_items_to_channel(4, [("links", 1), ("qr", 2)])
+    assert [result['path'] for result in results] == ["channel/4/assign/links/1", "channel/4/assign/qr/2"]
+
+@needs_aiohttp
+def test_async_bulk_assign_keeps_order_and_retries_failures_once(server, run_async):
+    server.handler = fail_first_attempt("3")
+    results = run_async(lambda api: api.assign_links_to_campaign(9, [1, 2, 3, 4]))
+    assert [result['item'] for result in results] == ["1", "2", "3", "4"]
+    assert server.count("campaign/9/assign/3") == 2
+
+def test_bulk_assign_reports_failures_that_persist_after_the_retry(server, make_api):
+    server.handler = lambda method, path, query, body: (
+        (200, {'error': 1, 'message': "Link not found"}) if path.endswith("/3") else (200, {'error': 0}))
+    with pytest.raises(BulkRequestError) as excinfo:
+        make_api().assign_links_to_campaign(9, [1, 2, 3, 4])
+    results = excinfo.value.results
+    assert results[:2] == [{'error': 0}] * 2 and results[3] == {'error': 0}
+    assert isinstance(results[2], ShotcutAPIError) and str(results[2]) == "Link not found"
+    assert server.count("campaign/9/assign/3") == 2
+
+@needs_aiohttp
+def test_async_bulk_assign_reports_failures_that_persist_after_the_retry(server, run_async):
+    server.handler = lambda method, path, query, body: (
+        (200, {'error': 1, 'message': "Link not found"}) if path.endswith("/3") else (200, {'error': 0}))
+    with pytest.raises(BulkRequestError) as excinfo:
+        run_async(lambda api: api.assign_links_to_campaign(9, [1, 2, 3, 4]))
+    results = excinfo.value.results
+    assert results[:2] == [{'error': 0}] * 2 and results[3] == {'error': 0}
+    assert isinstance(results[2], ShotcutAPIError) and str(results[2]) == "Link not found"
+    assert server.count("campaign/9/assign/3") == 2
+
+def test_url_body_encoder_matches_full_encoding():
+    encode = make_url_body_encoder({'domain': 'go.example.com', 'expiry': None, 'public': True})
+    body = encode("https://example.com/a?b=1")
+    assert json.loads(body) == {'url': "https://example.com/a?b=1", 'domain': 'go.example.com',
+                                'expiry': None, 'public': True}
+
+def test_url_body_encoder_escapes_the_url():
+    encode = make_url_body_encoder({'custom': 'x'})
+    url = 'https://example.com/"quoted"\\path\né'
+    assert json.loads(encode(url))['url'] == url
+
+def test_url_body_encoder_without_common_fields():
+    assert json.loads(make_url_body_encoder({})("https://example.com")) == {'url': "https://example.com"}
+
+def test_url_body_encoder_lets_the_url_win_over_common_fields():
+    encode = make_url_body_encoder({'url': "https://ignored.example.com", 'custom': 'x'})
+    assert json.loads(encode("https://example.com")) == {'url': "https://example.com", 'custom': 'x'}
+
+def test_shorten_links_bulk_keeps_order(server, make_api):
+    urls = [f"https://example.com/{i}" for i in range(10)]
+    results = make_api().shorten_links_bulk(urls, domain="go.example.com")
+    assert [result['body'] for result in results] == [{'url': url, 'domain': "go.example.com"} for url in urls]
+
+def test_shorten_links_bulk_reports_partial_failures(server, make_api):
+    def handler(method, path, query, body):
+        if body['url'].endswith("/bad"):
+            return 200, {'error': 1, 'message': "Invalid URL"}
+        return 200, {'error': 0, 'shorturl': body['url']}
+    server.handler = handler
+    urls = ["https://example.com/a", "https://example.com/bad", "https://example.com/c"]
+    with pytest.raises(BulkRequestError) as excinfo:
+        make_api().shorten_links_bulk(urls)
+    first, failed, last = excinfo.value.results
+    assert first['shorturl'] == urls[0] and last['shorturl'] == urls[2]
+    assert isinstance(failed, ShotcutAPIError) and str(failed) == "Invalid URL"
+    # Failed shortening requests are not retried
+    assert server.count() == 3
+
+@needs_aiohttp
+def test_async_shorten_links_bulk_reports_partial_failures(server, run_async):
+    def handler(method, path, query, body):
+        if body['url'].endswith("/bad"):
+            return 200, {'error': 1, 'message': "Invalid URL"}
+        return 200, {'error': 0, 'shorturl': body['url']}
+    server.handler = handler
+    urls = ["https://example.com/a", "https://example.com/bad", "https://example.com/c"]
+    with pytest.raises(BulkRequestError) as excinfo:
+        run_async(lambda api: api.shorten_links_bulk(urls))
+    first, failed, last = excinfo.value.results
+    assert first['shorturl'] == urls[0] and last['shorturl'] == urls[2]
+    assert isinstance(failed, ShotcutAPIError)
+    assert server.count() == 3
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+from shotcut import ShotcutAPIError
+
+pytest.importorskip("cachetools")
+
+def test_cache_is_off_by_default(server, make_api):
+    api = make_api()
+    api.get_account()
+    api.get_account()
+    assert server.count() == 2
+
+def test_cache_serves_repeated_gets(server, make_api):
+    api = make_api(cache_ttl=60)
+    api.get_link(42)
+    api.get_link(42)
+    assert server.count() == 1
+
+def test_cache_returns_copies(server, make_api):
+    api = make_api(cache_ttl=60)
+    api.get_link(42)['path'] = "changed"
+    assert api.get_link(42)['path'] == "url/42"
+
+def test_update_invalidates_the_item_and_list_pages(server, make_api):
+    api = make_api(cache_ttl=60)
+    api.get_link(42)
+    api.list_links()
+    api.update_link(42, url="https://example.com")
+    api.get_link(42)
+    api.list_links()
+    assert server.count("url/42") == 2
+    assert server.count("urls") == 2
+
+def test_create_invalidates_list_pages(server, make_api):
+    api = make_api(cache_ttl=60)
+    api.list_links()
+    api.shorten_link("https://example.com")
+    api.list_links()
+    assert server.count("urls") == 2
+
+def test_failed_write_still_invalidates(server, make_api):
+    api = make_api(cache_ttl=60)
+    api.list_campaigns()
+    server.handler = lambda *request: (200, {'error': 1, 'message': "Campaign not found"})
+    with pytest.raises(ShotcutAPIError):
+        api.delete_campaign(5)
+    server.handler = server.echo
+    api.list_campaigns()
+    assert server.count("campaigns") == 2
+
+def test_invalidate_clears_the_cache(server, make_api):
+    api = make_api(cache_ttl=60)
+    api.get_account()
+    api.invalidate()
+    api.get_account()
+    assert server.count() == 2
+
+def test_cached_entries_expire_after_the_ttl(server, make_api):
+    api = make_api(cache_ttl=0.2)
+    api.get_account()
+    time.sleep(0.3)
+    api.get_account()
+    assert server.count() == 2
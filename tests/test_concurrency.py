@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from shotcut import ShotcutAPIAsync
+from shotcut.async_api import _AIMDGate, aiohttp
+
+pytestmark = pytest.mark.skipif(aiohttp is None, reason="requires the async extra")
+
+def test_aimd_gate_grows_under_target_latency():
+    gate = _AIMDGate(initial=4, maximum=6, target_latency=0.5, increase=1)
+    for _ in range(5):
+        gate.record_success(0.1)
+    assert gate.concurrency == 6
+
+def test_aimd_gate_does_not_grow_over_target_latency():
+    gate = _AIMDGate(initial=4, target_latency=0.5)
+    gate.record_success(2.0)
+    assert gate.concurrency == 4
+
+def test_aimd_gate_halves_on_overload_down_to_minimum():
+    gate = _AIMDGate(initial=8, minimum=2)
+    gate.record_overload(time.monotonic())
+    assert gate.concurrency == 4
+    gate.record_overload(time.monotonic())
+    gate.record_overload(time.monotonic())
+    assert gate.concurrency == 2
+
+def test_aimd_gate_halves_once_per_burst_of_in_flight_overloads():
+    gate = _AIMDGate(initial=64, maximum=64)
+    started = time.monotonic()
+    for _ in range(64):
+        gate.record_overload(started)
+    assert gate.concurrency == 32
+    # A request sent after the decrease can shrink the window again
+    gate.record_overload(time.monotonic())
+    assert gate.concurrency == 16
+
+def test_concurrent_429s_shrink_the_window_once(server, run_async):
+    burst = threading.Barrier(16, timeout=5)
+
+    def handler(method, path, query, body):
+        if server.count() <= 16:
+            # Reject the first 16 requests together, once all of them are in flight
+            burst.wait()
+            return 429, {'error': 1, 'message': "slow down"}
+        return 200, {'error': 0}
+    server.handler = handler
+
+    async def send_burst(api):
+        _, gate = api._get_session()
+        gate.concurrency = 16
+        await asyncio.gather(*[api.get_account() for _ in range(16)])
+        return gate.concurrency
+
+    # A tiny latency target keeps the successful retries from growing the window again
+    assert run_async(send_burst, max_concurrency=16, target_latency=0.0) == 8
+
+def test_client_can_be_reused_across_event_loops(server):
+    server.handler = lambda *request: (200, {'error': 0})
+    api = ShotcutAPIAsync("test-key", initial_concurrency=2)
+    api.base_url = server.base_url
+
+    async def send_burst():
+        async with api:
+            return await asyncio.gather(*[api.get_account() for _ in range(10)])
+
+    # The second run contends for the gate on a new loop after the first one closed the client
+    assert asyncio.run(send_burst()) == [{'error': 0}] * 10
+    assert asyncio.run(send_burst()) == [{'error': 0}] * 10
+    assert api._session is None
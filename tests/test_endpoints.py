@@ -0,0 +1,50 @@
+import ast
+import inspect
+
+import pytest
+
+import shotcut.api
+import shotcut.async_api
+from shotcut import ShotcutAPI, ShotcutAPIAsync
+from shotcut.endpoints import ENDPOINTS
+
+
+def declared_methods(module, class_name):
+    """Methods declared under ``if TYPE_CHECKING:`` in a client class body"""
+    tree = ast.parse(inspect.getsource(module))
+    cls = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == class_name)
+    declared = {}
+    for node in cls.body:
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == 'TYPE_CHECKING':
+            for method in node.body:
+                declared[method.name] = method
+    return declared
+
+@pytest.mark.parametrize('module, cls', [(shotcut.api, ShotcutAPI), (shotcut.async_api, ShotcutAPIAsync)])
+def test_type_checking_declarations_match_generated_methods(module, cls):
+    declared = declared_methods(module, cls.__name__)
+    assert set(declared) == {endpoint.name for endpoint in ENDPOINTS}
+    for name, node in declared.items():
+        generated = getattr(cls, name)
+        assert isinstance(node, ast.AsyncFunctionDef) == inspect.iscoroutinefunction(generated), name
+        parameters = inspect.signature(generated).parameters.values()
+        assert [arg.arg for arg in node.args.args] == [parameter.name for parameter in parameters], name
+        defaults = [ast.literal_eval(default) for default in node.args.defaults]
+        assert defaults == [p.default for p in parameters if p.default is not inspect.Parameter.empty], name
+        annotations = [ast.unparse(arg.annotation) for arg in node.args.args[1:]]
+        assert annotations == [inspect.formatannotation(p.annotation) for p in list(parameters)[1:]], name
+
+def test_generated_methods_fill_path_templates(server, make_api):
+    api = make_api()
+    assert api.get_link(42)['path'] == "url/42"
+    assert api.assign_item_to_channel(3, "links", 7)['path'] == "channel/3/assign/links/7"
+    assert api.delete_qr_code(5)['method'] == "DELETE"
+
+def test_generated_methods_drop_unset_query_parameters(server, make_api):
+    assert make_api().list_links(limit=5)['query'] == {'limit': '5', 'page': '1', 'order': 'date'}
+    assert make_api().list_links(short="abc")['query']['short'] == "abc"
+
+def test_hand_written_methods_share_the_path_helper(server, make_api):
+    api = make_api()
+    assert api.update_link(42, url="https://example.com")['path'] == "url/42/update"
+    assert api.update_qr_code(5, data="x")['path'] == "qr/5/update"
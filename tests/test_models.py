@@ -0,0 +1,58 @@
+import sys
+from datetime import datetime
+
+import pytest
+
+import shotcut.models
+from shotcut.models import (Link, convert_datetime, create_model_from_response,
+                            hydrate_page)
+
+try:
+    from ciso8601 import parse_datetime_as_naive
+except ImportError:
+    parse_datetime_as_naive = None
+
+PARSERS = [shotcut.models._slice_datetime,
+           pytest.param(parse_datetime_as_naive, marks=pytest.mark.skipif(parse_datetime_as_naive is None,
+                                                                          reason="requires the speedups extra"))]
+
+
+@pytest.fixture(params=PARSERS)
+def parser(request, monkeypatch):
+    """Run a test with each available datetime parser"""
+    monkeypatch.setattr(shotcut.models, '_parse_datetime', request.param)
+    convert_datetime.cache_clear()
+    yield
+    convert_datetime.cache_clear()
+
+def test_convert_datetime_parses_the_api_layout(parser):
+    assert convert_datetime("2024-01-02 03:04:05") == datetime(2024, 1, 2, 3, 4, 5)
+
+@pytest.mark.parametrize('value', [
+    None, "", "2024-01-02", "2024-01-02T03:04:05", "2024-01-02 03:04:05+02:00", "2024-01-02 03:04:05\n",
+    "2024-1-02 03:04:05", "2024-02-30 00:00:00", "not a date",
+])
+def test_convert_datetime_rejects_other_layouts(parser, value):
+    assert convert_datetime(value) is None
+
+def link_row(**overrides):
+    row = {'id': 1, 'created_at': "2024-01-02 03:04:05", 'updated_at': "2024-01-02 03:04:05",
+           'url': "https://example.com", 'shorturl': "https://shotcut.in/a"}
+    row.update(overrides)
+    return row
+
+def test_hydrate_page_converts_datetimes_and_drops_unknown_keys():
+    (link,) = hydrate_page(Link, [link_row(expiry="2025-12-31 00:00:00", added_later=True)])
+    assert link.created_at == datetime(2024, 1, 2, 3, 4, 5)
+    assert link.expiry == datetime(2025, 12, 31)
+
+def test_create_model_reports_missing_fields():
+    with pytest.raises(ValueError, match="Link"):
+        create_model_from_response(Link, {'id': 1})
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_models_are_slotted():
+    link = create_model_from_response(Link, link_row())
+    assert not hasattr(link, '__dict__')
+    with pytest.raises(AttributeError):
+        link.not_a_field = 1
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from shotcut.async_api import aiohttp
+from shotcut.utils import get_total_pages
+
+needs_aiohttp = pytest.mark.skipif(aiohttp is None, reason="requires the async extra")
+
+def test_iterate_all_yields_pages_in_order(server, make_api):
+    def handler(method, path, query, body):
+        page = int(query['page'])
+        # Earlier pages answer last, so completion order differs from page order
+        time.sleep(0.05 * (5 - page))
+        return 200, {'error': 0, 'total_pages': 5, 'page': page}
+    server.handler = handler
+    pages = list(make_api().iterate_all("urls", limit=10, max_workers=4))
+    assert [page['page'] for page in pages] == [1, 2, 3, 4, 5]
+
+def test_iterate_all_stops_after_a_single_page(server, make_api):
+    assert len(list(make_api().iterate_all("urls"))) == 1
+    assert server.count() == 1
+
+@needs_aiohttp
+def test_async_iterate_all_yields_pages_in_order(server, run_async):
+    def handler(method, path, query, body):
+        page = int(query['page'])
+        time.sleep(0.05 * (5 - page))
+        return 200, {'error': 0, 'total_pages': 5, 'page': page}
+    server.handler = handler
+
+    async def collect(api):
+        return [page['page'] async for page in api.iterate_all("urls")]
+
+    assert run_async(collect) == [1, 2, 3, 4, 5]
+
+def test_get_total_pages():
+    assert get_total_pages({'total_pages': 3}) == 3
+    assert get_total_pages({'data': {'total_pages': '4'}}) == 4
+    assert get_total_pages({}) == 1
+    assert get_total_pages({'total_pages': 0}) == 1
@@ -0,0 +1,67 @@
+import time
+
+from shotcut.ratelimit import BACKOFF_CAP, HeaderRateLimiter, backoff_delay
+
+
+def headers(remaining, limit=100, reset_in=30.0):
+    return {
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Reset': str(time.time() + reset_in),
+    }
+
+def test_backoff_delay_doubles_and_caps():
+    assert backoff_delay(0) == 0.5
+    assert backoff_delay(1) == 1.0
+    assert backoff_delay(3) == 4.0
+    assert backoff_delay(20) == BACKOFF_CAP
+
+def test_delay_is_zero_before_any_response():
+    assert HeaderRateLimiter().delay() == 0.0
+
+def test_update_records_headers():
+    limiter = HeaderRateLimiter()
+    limiter.update(headers(42, limit=60))
+    assert limiter.remaining == 42
+    assert limiter.limit == 60
+    assert limiter.reset_ts > time.time()
+
+def test_update_ignores_responses_without_rate_limit_headers():
+    limiter = HeaderRateLimiter()
+    limiter.update(headers(42))
+    limiter.update({})
+    assert limiter.remaining == 42
+
+def test_update_ignores_malformed_values():
+    limiter = HeaderRateLimiter()
+    limiter.update(headers(42))
+    limiter.update({'X-RateLimit-Remaining': 'soon'})
+    assert limiter.remaining == 42
+
+def test_update_picks_up_a_new_window():
+    limiter = HeaderRateLimiter()
+    limiter.update(headers(1, reset_in=30))
+    first_reset = limiter.reset_ts
+    limiter.update(headers(99, reset_in=90))
+    assert limiter.remaining == 99
+    assert limiter.reset_ts > first_reset
+
+def test_delay_is_zero_while_quota_is_above_reserve():
+    limiter = HeaderRateLimiter(min_remaining=2, threshold=0.1)
+    limiter.update(headers(11, limit=100))
+    assert limiter.delay() == 0.0
+
+def test_delay_waits_for_reset_once_quota_hits_reserve():
+    limiter = HeaderRateLimiter(min_remaining=2, threshold=0.1)
+    limiter.update(headers(10, limit=100, reset_in=30))
+    assert 29 < limiter.delay() <= 30
+
+def test_delay_keeps_min_remaining_when_threshold_is_smaller():
+    limiter = HeaderRateLimiter(min_remaining=5, threshold=0.01)
+    limiter.update(headers(5, limit=100, reset_in=30))
+    assert limiter.delay() > 0
+
+def test_delay_is_zero_once_reset_has_passed():
+    limiter = HeaderRateLimiter()
+    limiter.update(headers(0, reset_in=-5))
+    assert limiter.delay() == 0.0
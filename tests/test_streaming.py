@@ -0,0 +1,56 @@
+import pytest
+
+from shotcut import RateLimitError, ShotcutAPIError
+from shotcut.api import httpx
+from shotcut.ratelimit import MAX_RETRIES
+
+pytest.importorskip("ijson")
+
+BACKENDS = [False, pytest.param(True, marks=pytest.mark.skipif(httpx is None, reason="requires the http2 extra"))]
+
+def link(link_id):
+    return {'id': link_id, 'created_at': "2024-01-02 03:04:05", 'updated_at': "2024-01-02 03:04:05",
+            'url': "https://example.com", 'shorturl': f"https://shotcut.in/{link_id}", 'clicks': 1}
+
+@pytest.mark.parametrize('http2', BACKENDS)
+def test_stream_links_hydrates_every_row(server, make_api, http2):
+    server.handler = lambda *request: (200, {'error': 0, 'items': [link(i) for i in range(300)]})
+    links = list(make_api(http2=http2).stream_links(limit=300, batch_size=64))
+    assert [item.id for item in links] == list(range(300))
+    assert links[0].created_at.year == 2024
+
+@pytest.mark.parametrize('http2', BACKENDS)
+def test_stream_links_raises_api_errors(server, make_api, http2):
+    server.handler = lambda *request: (200, {'error': 1, 'message': "Invalid API key"})
+    with pytest.raises(ShotcutAPIError, match="Invalid API key"):
+        list(make_api(http2=http2).stream_links())
+
+def test_stream_links_raises_api_errors_reported_after_the_message(server, make_api):
+    server.handler = lambda *request: (200, b'{"message": "Invalid API key", "error": 1}')
+    with pytest.raises(ShotcutAPIError, match="Invalid API key"):
+        list(make_api().stream_links())
+
+@pytest.mark.parametrize('http2', BACKENDS)
+def test_stream_links_raises_the_message_of_error_statuses(server, make_api, http2):
+    server.handler = lambda *request: (401, {'error': 1, 'message': "Invalid API key"})
+    with pytest.raises(ShotcutAPIError, match="Invalid API key") as excinfo:
+        list(make_api(http2=http2).stream_links())
+    assert excinfo.value.status_code == 401
+    assert excinfo.value.response == {'error': 1, 'message': "Invalid API key"}
+
+def test_stream_links_falls_back_to_the_status_for_non_json_errors(server, make_api):
+    server.handler = lambda *request: (500, b"<html>Internal Server Error</html>")
+    with pytest.raises(ShotcutAPIError, match="status 500"):
+        list(make_api().stream_links())
+
+def test_stream_links_retries_429(server, make_api):
+    responses = [429, 429, 200]
+    server.handler = lambda *request: (responses.pop(0), {'error': 0, 'items': [link(1)]})
+    assert [item.id for item in make_api().stream_links()] == [1]
+    assert server.count() == 3
+
+def test_stream_links_raises_after_max_retries(server, make_api):
+    server.handler = lambda *request: (429, {'error': 1, 'message': "slow down"})
+    with pytest.raises(RateLimitError):
+        list(make_api().stream_links())
+    assert server.count() == MAX_RETRIES + 1
@@ -0,0 +1,8 @@
+from shotcut.utils import validate_rgb_color
+
+
+def test_validate_rgb_color():
+    assert validate_rgb_color("rgb(0, 128,255)")
+    assert validate_rgb_color(None)
+    assert not validate_rgb_color("rgb(0,0,256)")
+    assert not validate_rgb_color("rgb(0,0,0)\n")